@@ -6,6 +6,7 @@ Use Case Đánh giá Khách hàng - Logic nghiệp vụ ứng dụng
 from typing import Optional
 from domain.services.evaluation_service import EvaluationService
 from domain.entities.evaluation import CustomerEvaluationResult
+from domain.entities.validation import validate_yyyymm
 
 
 class EvaluateCustomerUseCase:
@@ -45,16 +46,19 @@ class EvaluateCustomerUseCase:
         Raises:
             ValueError: Nếu tham số đầu vào không hợp lệ
         """
-        # Validation
-        if not customer_code or not customer_code.strip():
+        # Validation - kiểm tra rẻ nhất trước: so sánh int (đã cache) rồi mới
+        # đến các phép strip trên string
+        if not validate_yyyymm(yyyymm):
+            raise ValueError("Invalid year-month format. Expected YYYYMM")
+
+        # isspace thay cho strip(): kiểm tra "toàn whitespace" không cần
+        # cấp phát chuỗi mới (isspace trả về False với chuỗi rỗng)
+        if not customer_code or customer_code.isspace():
             raise ValueError("Customer code cannot be empty")
-        
-        if not program_code or not program_code.strip():
+
+        if not program_code or program_code.isspace():
             raise ValueError("Program code cannot be empty")
         
-        if yyyymm < 202001 or yyyymm > 999912:
-            raise ValueError("Invalid year-month format. Expected YYYYMM")
-        
         # Execute evaluation
         return self.evaluation_service.evaluate_customer(
             yyyymm, customer_code.strip(), program_code.strip()
@@ -7,6 +7,7 @@ from .customer import Customer
 from .program import Program, RegisterItem
 from .evaluation import ConditionGroup, ConditionItem, AuditPicture, CustomerEvaluationResult
 from .registration import Registration
+from .validation import format_yyyymm_display, validate_yyyymm, validate_yyyymm_batch
 
 __all__ = [
     'Customer',
@@ -16,5 +17,8 @@ __all__ = [
     'ConditionItem', 
     'AuditPicture',
     'CustomerEvaluationResult',
-    'Registration'
+    'Registration',
+    'format_yyyymm_display',
+    'validate_yyyymm',
+    'validate_yyyymm_batch'
 ]
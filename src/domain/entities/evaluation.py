@@ -3,16 +3,26 @@ Evaluation Entities - Domain Models
 Các thực thể Đánh giá - Mô hình Domain
 """
 
+import re
+import sys
 from dataclasses import dataclass
+from functools import cached_property
 from typing import List, Optional
 from datetime import datetime
 
+# Nhận diện chuỗi số thập phân (có thể âm) - compile một lần ở module level
+_FLOATISH_RE = re.compile(r'^-?\d+(\.\d+)?$')
 
-@dataclass
+
+@dataclass(slots=True)
 class ConditionGroup:
     """
     ConditionGroup Entity - Nhóm điều kiện đánh giá
-    
+
+    📝 GIẢI THÍCH:
+    - slots: bỏ __dict__ per-instance - quan trọng khi mỗi lượt đánh giá
+      nạp hàng loạt nhóm điều kiện từ database
+
     Attributes:
         yyyymm (int): Tháng năm theo định dạng YYYYMM
         program_code (str): Mã chương trình
@@ -25,7 +35,12 @@ class ConditionGroup:
     group: int
     type_code: str
     group_point: int
-    
+
+    def __post_init__(self):
+        """Intern các mã: equality trên mã đã intern là so sánh con trỏ"""
+        self.program_code = sys.intern(self.program_code)
+        self.type_code = sys.intern(self.type_code)
+
     def __eq__(self, other) -> bool:
         """So sánh hai ConditionGroup có bằng nhau không"""
         if not isinstance(other, ConditionGroup):
@@ -47,11 +62,11 @@ class ConditionGroup:
         return f"ConditionGroup(yyyymm={self.yyyymm}, program_code='{self.program_code}', group={self.group}, type_code='{self.type_code}', group_point={self.group_point})"
 
 
-@dataclass
+@dataclass(slots=True)
 class ConditionItem:
     """
     ConditionItem Entity - Điều kiện đánh giá cụ thể
-    
+
     Attributes:
         yyyymm (int): Tháng năm theo định dạng YYYYMM
         program_code (str): Mã chương trình
@@ -66,7 +81,12 @@ class ConditionItem:
     condition_code: str
     condition_min_value: int
     condition_point: int
-    
+
+    def __post_init__(self):
+        """Intern các mã: equality trên mã đã intern là so sánh con trỏ"""
+        self.program_code = sys.intern(self.program_code)
+        self.condition_code = sys.intern(self.condition_code)
+
     def __eq__(self, other) -> bool:
         """So sánh hai ConditionItem có bằng nhau không"""
         if not isinstance(other, ConditionItem):
@@ -101,11 +121,11 @@ class ConditionItem:
         return f"ConditionItem(yyyymm={self.yyyymm}, program_code='{self.program_code}', group={self.group}, condition_code='{self.condition_code}', condition_min_value={self.condition_min_value}, condition_point={self.condition_point})"
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditPicture:
     """
     AuditPicture Entity - Kết quả audit thực tế
-    
+
     Attributes:
         yyyymm (int): Tháng năm theo định dạng YYYYMM
         customer_code (str): Mã khách hàng
@@ -118,22 +138,35 @@ class AuditPicture:
     condition_code: str
     value: str
     audit_date: Optional[datetime] = None
-    
+
+    def __post_init__(self):
+        """Intern các mã: equality trên mã đã intern là so sánh con trỏ"""
+        self.customer_code = sys.intern(self.customer_code)
+        self.condition_code = sys.intern(self.condition_code)
+
     @property
     def numeric_value(self) -> int:
         """
         Chuyển đổi value từ string sang int
-        
+
+        📝 GIẢI THÍCH:
+        - Fast path: giá trị audit trong thực tế gần như luôn là chuỗi
+          toàn chữ số, isdigit + int rẻ hơn nhiều so với đi qua float
+        - Giá trị thập phân ("85.7") được cắt về int; chuỗi không phải
+          số vẫn raise ValueError như trước
+
         Returns:
             int: Giá trị số của audit result
-            
+
         Raises:
             ValueError: Nếu value không thể chuyển đổi thành số
         """
-        try:
-            return int(self.value)
-        except ValueError:
-            raise ValueError(f"Cannot convert audit value '{self.value}' to integer")
+        v = self.value
+        if v.isdigit():
+            return int(v)
+        if _FLOATISH_RE.match(v):
+            return int(float(v))
+        raise ValueError(f"Cannot convert audit value '{v}' to integer")
     
     def __eq__(self, other) -> bool:
         """So sánh hai AuditPicture có bằng nhau không"""
@@ -180,21 +213,25 @@ class CustomerEvaluationResult:
     failed_conditions: List[str]
     registration_status: bool
     
-    @property
+    @cached_property
     def is_eligible_for_reward(self) -> bool:
         """
         Kiểm tra khách hàng có đủ điều kiện nhận thưởng không
-        
+
+        📝 GIẢI THÍCH:
+        - cached_property: kết quả đánh giá là bản ghi chỉ-đọc sau khi
+          service tạo ra, nên tính một lần rồi đọc lại từ __dict__
+
         Returns:
             bool: True nếu đủ điều kiện, False nếu không
         """
         return self.meets_criteria and self.registration_status
-    
-    @property
+
+    @cached_property
     def success_rate(self) -> float:
         """
         Tính tỷ lệ thành công (phần trăm)
-        
+
         Returns:
             float: Tỷ lệ thành công từ 0.0 đến 100.0
         """
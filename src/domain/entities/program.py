@@ -3,7 +3,8 @@ Program Entity - Domain Model
 Thực thể Chương trình - Mô hình Domain
 """
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from typing import List, Optional
 from datetime import datetime
 
@@ -51,11 +52,15 @@ class Program:
         return f"Program(program_code='{self.program_code}', name='{self.name}')"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RegisterItem:
     """
     RegisterItem Entity - Cấu hình kệ trưng bày cho chương trình
-    
+
+    📝 GIẢI THÍCH:
+    - frozen + slots: record 6 trường bất biến, không mang __dict__
+      (~88 bytes thay vì ~296), truy cập field qua slot descriptor
+
     Attributes:
         yyyymm (int): Tháng năm theo định dạng YYYYMM
         program_code (str): Mã chương trình
@@ -70,7 +75,19 @@ class RegisterItem:
     item: str
     facing: int
     unit: int
-    
+    # Hash của khóa tính sẵn một lần lúc dựng - instance bất biến nên an toàn
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Intern các mã và tính sẵn hash của khóa"""
+        # frozen dataclass nên phải gán qua object.__setattr__
+        object.__setattr__(self, 'program_code', sys.intern(self.program_code))
+        object.__setattr__(self, 'type_code', sys.intern(self.type_code))
+        object.__setattr__(self, 'item', sys.intern(self.item))
+        object.__setattr__(self, '_hash', hash(
+            (self.yyyymm, self.program_code, self.type_code, self.item)
+        ))
+
     def __eq__(self, other) -> bool:
         """So sánh hai RegisterItem có bằng nhau không"""
         if not isinstance(other, RegisterItem):
@@ -81,8 +98,8 @@ class RegisterItem:
                 self.item == other.item)
     
     def __hash__(self) -> int:
-        """Hash cho RegisterItem"""
-        return hash((self.yyyymm, self.program_code, self.type_code, self.item))
+        """Hash cho RegisterItem - trả về giá trị đã tính sẵn trong __post_init__"""
+        return self._hash
     
     def __str__(self) -> str:
         """String representation"""
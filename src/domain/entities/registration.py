@@ -3,16 +3,21 @@ Registration Entity - Domain Model
 Thực thể Đăng ký - Mô hình Domain
 """
 
+import sys
 from dataclasses import dataclass
 from typing import Optional
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Registration:
     """
     Registration Entity - Đăng ký chương trình của khách hàng
-    
+
+    📝 GIẢI THÍCH:
+    - slots: bỏ __dict__ per-instance; không frozen vì activate/deactivate
+      cần gán lại status/updated_at
+
     Attributes:
         yyyymm (int): Tháng năm theo định dạng YYYYMM
         program_code (str): Mã chương trình
@@ -31,7 +36,13 @@ class Registration:
     status: bool
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
-    
+
+    def __post_init__(self):
+        """Intern các mã: equality trên mã đã intern là so sánh con trỏ"""
+        self.program_code = sys.intern(self.program_code)
+        self.customer_code = sys.intern(self.customer_code)
+        self.display_type = sys.intern(self.display_type)
+
     @property
     def is_active(self) -> bool:
         """
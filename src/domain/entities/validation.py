@@ -0,0 +1,78 @@
+"""
+Validation Helpers - Domain Model
+Các hàm kiểm tra dữ liệu dùng chung cho tầng domain
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+# Khoảng yyyymm hợp lệ của hệ thống (khớp validation ở EvaluateCustomerUseCase)
+MIN_YYYYMM = 202001
+MAX_YYYYMM = 999912
+
+
+@lru_cache(maxsize=256)
+def validate_yyyymm(yyyymm: int) -> bool:
+    """
+    Kiểm tra giá trị tháng năm theo định dạng YYYYMM
+
+    📝 GIẢI THÍCH:
+    - Hệ thống chỉ làm việc với một nhóm nhỏ giá trị yyyymm (vài tháng
+      gần nhất), nên lru_cache biến các lần kiểm tra lặp lại thành một
+      phép tra dict - hàm thuần trên int hashable nên cache an toàn
+    - Ngoài kiểm tra khoảng, tách phần tháng để loại các giá trị kiểu
+      202013 (tháng 13 không tồn tại)
+
+    Args:
+        yyyymm (int): Tháng năm theo định dạng YYYYMM
+
+    Returns:
+        bool: True nếu hợp lệ, False nếu không
+    """
+    if yyyymm < MIN_YYYYMM or yyyymm > MAX_YYYYMM:
+        return False
+    month = yyyymm % 100
+    return 1 <= month <= 12
+
+
+@lru_cache(maxsize=128)
+def format_yyyymm_display(yyyymm: int) -> str:
+    """
+    Định dạng yyyymm thành chuỗi hiển thị "Tháng MM/YYYY"
+
+    📝 GIẢI THÍCH:
+    - Hàm thuần trên int, UI/báo cáo lặp lại cùng vài tháng trên mọi
+      dòng nên lru_cache biến các lần format sau thành một phép tra dict
+
+    Args:
+        yyyymm (int): Tháng năm theo định dạng YYYYMM
+
+    Returns:
+        str: Chuỗi hiển thị, ví dụ "Tháng 09/2025"; giá trị không hợp lệ
+             trả về str(yyyymm) nguyên trạng
+    """
+    if not validate_yyyymm(yyyymm):
+        return str(yyyymm)
+    year, month = divmod(yyyymm, 100)
+    return f"Tháng {month:02d}/{year}"
+
+
+def validate_yyyymm_batch(values) -> np.ndarray:
+    """
+    Kiểm tra hàng loạt giá trị yyyymm bằng numpy
+
+    📝 GIẢI THÍCH:
+    - Cùng quy tắc với validate_yyyymm nhưng chạy trên cả mảng một lần
+      (broadcast C-level) thay vì vòng lặp Python từng phần tử - dùng
+      cho các đường batch kiểu pandas/numpy như demo1
+
+    Args:
+        values: Mảng hoặc sequence các giá trị yyyymm (int)
+
+    Returns:
+        np.ndarray: Mảng bool cùng độ dài, True tại vị trí hợp lệ
+    """
+    arr = np.asarray(values)
+    month = arr % 100
+    return (arr >= MIN_YYYYMM) & (arr <= MAX_YYYYMM) & (month >= 1) & (month <= 12)
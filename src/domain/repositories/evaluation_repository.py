@@ -3,17 +3,24 @@ Evaluation Repository Interface - Domain Contract
 Giao diện Evaluation Repository - Hợp đồng Domain
 """
 
-from abc import ABC, abstractmethod
-from typing import List, Optional
+from abc import abstractmethod
+from typing import List, Optional, Protocol, runtime_checkable
 from ..entities.evaluation import ConditionGroup, ConditionItem, AuditPicture, CustomerEvaluationResult
 
 
-class EvaluationRepository(ABC):
+@runtime_checkable
+class EvaluationRepository(Protocol):
     """
-    Abstract Evaluation Repository - Định nghĩa các thao tác với dữ liệu đánh giá
-    
+    Evaluation Repository Protocol - Định nghĩa các thao tác với dữ liệu đánh giá
+
     Interface này định nghĩa các phương thức cần thiết để thao tác với
     dữ liệu đánh giá mà không phụ thuộc vào implementation cụ thể.
+
+    📝 GIẢI THÍCH:
+    - Protocol + runtime_checkable: isinstance kiểm tra cấu trúc (có đủ
+      method không) và cache kết quả theo class, thay vì walk bảng
+      đăng ký ABC; kế thừa tường minh như SqlServerEvaluationRepository
+      vẫn hoạt động như với ABC cũ
     """
     
     # ConditionGroup operations
@@ -4,36 +4,67 @@ Kết nối SQL Server - Triển khai hạ tầng
 """
 
 import pyodbc
+import queue
 import logging
 from typing import Optional
 from contextlib import contextmanager
+from functools import cached_property
+
+# Pool được quản lý ở tầng ứng dụng (xem SqlServerConnection._pools);
+# tắt pooling của ODBC driver để không giữ connection trùng lặp ở hai tầng
+pyodbc.pooling = False
+
+
+# Template connection string dựng sẵn ở module level: phần DRIVER và cấu trúc
+# không đổi giữa các instance, mỗi lần khởi tạo chỉ cần một .format() điền giá trị
+_TRUSTED_TEMPLATE = (
+    "DRIVER={{ODBC Driver 17 for SQL Server}};"
+    "SERVER={server};"
+    "DATABASE={database};"
+    "Trusted_Connection=yes;"
+)
+_SQL_AUTH_TEMPLATE = (
+    "DRIVER={{ODBC Driver 17 for SQL Server}};"
+    "SERVER={server};"
+    "DATABASE={database};"
+    "UID={username};"
+    "PWD={password};"
+    "MultipleActiveResultSets=True;"
+)
 
 
 class SqlServerConnection:
     """
     SQL Server Connection - Quản lý kết nối SQL Server
-    
+
     Class này chịu trách nhiệm quản lý kết nối đến SQL Server database
-    và cung cấp context manager để đảm bảo connection được đóng đúng cách.
+    và cung cấp context manager để đảm bảo connection được trả về pool
+    (hoặc đóng khi có lỗi) đúng cách.
     """
-    
+
+    # Pool kết nối dùng chung cho toàn process, phân theo connection string.
+    # LIFO để connection vừa dùng xong (còn "nóng") được tái sử dụng trước.
+    _pools = {}
+
     def __init__(
-        self, 
-        server: str = "xxxx", 
-        database: str = "xxxx", 
-        username: str = "xxxx", 
-        password: str = "xx@xxx", 
-        trusted_connection: bool = False
+        self,
+        server: str = "xxxx",
+        database: str = "xxxx",
+        username: str = "xxxx",
+        password: str = "xx@xxx",
+        trusted_connection: bool = False,
+        pool_size: int = 5
     ):
         """
         Khởi tạo kết nối SQL Server
-        
+
         Args:
             server (str): Tên server SQL Server
             database (str): Tên database cần kết nối
             username (str): Username cho SQL authentication
             password (str): Password cho SQL authentication
             trusted_connection (bool): Sử dụng Windows Authentication
+            pool_size (int): Số connection tối đa giữ lại trong pool
         """
         # Thiết lập logging trước
         logging.basicConfig(level=logging.INFO)
@@ -44,101 +75,183 @@ class SqlServerConnection:
         self.username = username
         self.password = password
         self.trusted_connection = trusted_connection
-        self.connection_string = self._build_connection_string()
-        
+        self.pool_size = pool_size
+
         self.logger.info(f"Initialized SQL Server connection for {database} on {server}")
     
+    @cached_property
+    def connection_string(self) -> str:
+        """
+        Connection string cho SQL Server
+
+        Dựng lười (lazy) và cache trên instance: chỉ trả phí format khi
+        connection string thực sự được dùng, các lần truy cập sau đọc
+        thẳng từ __dict__ không qua descriptor.
+
+        Returns:
+            str: Connection string hoàn chỉnh
+        """
+        return self._build_connection_string()
+
     def _build_connection_string(self) -> str:
         """
         Xây dựng connection string cho SQL Server
-        
+
         Returns:
             str: Connection string hoàn chỉnh
         """
         if self.trusted_connection:
-            conn_str = (
-                f"DRIVER={{ODBC Driver 17 for SQL Server}};"
-                f"SERVER={self.server};"
-                f"DATABASE={self.database};"
-                f"Trusted_Connection=yes;"
+            conn_str = _TRUSTED_TEMPLATE.format(
+                server=self.server,
+                database=self.database
             )
         else:
-            conn_str = (
-                f"DRIVER={{ODBC Driver 17 for SQL Server}};"
-                f"SERVER={self.server};"
-                f"DATABASE={self.database};"
-                f"UID={self.username};"
-                f"PWD={self.password};"
-                f"MultipleActiveResultSets=True;"
+            conn_str = _SQL_AUTH_TEMPLATE.format(
+                server=self.server,
+                database=self.database,
+                username=self.username,
+                password=self.password
             )
-        
+
         self.logger.debug(f"Built connection string for {self.server}/{self.database}")
         return conn_str
     
+    def _get_pool(self) -> queue.LifoQueue:
+        """
+        Lấy (hoặc tạo) pool kết nối cho connection string hiện tại
+
+        Returns:
+            queue.LifoQueue: Pool kết nối
+        """
+        pool = self._pools.get(self.connection_string)
+        if pool is None:
+            pool = self._pools.setdefault(
+                self.connection_string, queue.LifoQueue(maxsize=self.pool_size)
+            )
+        return pool
+
     @contextmanager
     def get_connection(self):
         """
         Context manager để quản lý database connection
-        
+
+        Connection được lấy từ pool nếu có sẵn (tránh trả chi phí
+        TCP + TDS handshake cho mỗi lần gọi); connection chết trong lúc
+        nằm pool bị loại qua một câu probe trước khi trao cho caller,
+        và chỉ mở kết nối mới khi pool cạn. Khi dùng xong, connection
+        được rollback rồi trả về pool thay vì đóng; connection gặp lỗi
+        bị loại bỏ khỏi pool và đóng hẳn.
+
         Yields:
             pyodbc.Connection: Database connection
         """
+        pool = self._get_pool()
         conn = None
+        while conn is None:
+            try:
+                candidate = pool.get_nowait()
+            except queue.Empty:
+                self.logger.debug("Establishing database connection")
+                conn = pyodbc.connect(self.connection_string)
+                self.logger.debug("Database connection established")
+                break
+            # Probe liveness: server có thể đã ngắt connection trong lúc
+            # nó nằm pool (idle timeout, failover) - một SELECT 1 rẻ hơn
+            # nhiều so với trao connection chết cho caller rồi fail query thật
+            try:
+                candidate.cursor().execute("SELECT 1").fetchval()
+            except pyodbc.Error:
+                try:
+                    candidate.close()
+                except pyodbc.Error:
+                    pass
+                self.logger.debug("Dropped dead pooled connection")
+            else:
+                conn = candidate
+                self.logger.debug("Reusing pooled database connection")
         try:
-            self.logger.debug("Establishing database connection")
-            conn = pyodbc.connect(self.connection_string)
-            self.logger.debug("Database connection established")
             yield conn
         except Exception as e:
+            # Connection có thể đã hỏng - rollback và đóng hẳn, không trả về pool
             self.logger.error(f"Database error: {e}")
-            if conn:
+            try:
                 conn.rollback()
+            finally:
+                conn.close()
+                self.logger.debug("Dropped failed database connection")
             raise
-        finally:
-            if conn:
-                self.logger.debug("Closing database connection")
+        else:
+            # Rollback trước khi trả về pool: pyodbc mặc định autocommit=False
+            # nên mọi lượt chỉ-đọc đều để lại một implicit transaction mở -
+            # không rollback thì connection nằm pool idle-in-transaction
+            # (giữ lock trên server) và borrower kế tiếp commit nhầm cả
+            # phần dở dang của lượt trước
+            try:
+                conn.rollback()
+            except pyodbc.Error:
                 conn.close()
-                self.logger.debug("Database connection closed")
+                self.logger.debug("Dropped connection that failed rollback")
+            else:
+                try:
+                    pool.put_nowait(conn)
+                    self.logger.debug("Returned database connection to pool")
+                except queue.Full:
+                    conn.close()
+                    self.logger.debug("Pool full - closed database connection")
     
+    def _probe_connect(self):
+        """
+        Mở kết nối autocommit nhẹ cho các câu probe chỉ đọc
+
+        Probe một lệnh (SELECT 1, @@VERSION) không cần transaction;
+        autocommit=True bỏ được cặp BEGIN/COMMIT ngầm - tiết kiệm hai
+        round-trip TDS cho mỗi lần probe.
+
+        Returns:
+            pyodbc.Connection: Connection với autocommit bật
+        """
+        return pyodbc.connect(self.connection_string, autocommit=True)
+
     def test_connection(self) -> bool:
         """
         Test kết nối database
-        
+
         Returns:
             bool: True nếu kết nối thành công, False nếu thất bại
         """
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT 1")
-                result = cursor.fetchone()
-                return result[0] == 1
+            conn = self._probe_connect()
+            try:
+                # fetchval: lấy thẳng giá trị cột đầu, không materialize Row object
+                return conn.cursor().execute("SELECT 1").fetchval() == 1
+            finally:
+                conn.close()
         except Exception as e:
             self.logger.error(f"Connection test failed: {e}")
             return False
-    
+
     def get_server_info(self) -> dict:
         """
         Lấy thông tin server
-        
+
         Returns:
             dict: Thông tin server
         """
         try:
-            with self.get_connection() as conn:
+            conn = self._probe_connect()
+            try:
                 cursor = conn.cursor()
-                cursor.execute("SELECT @@VERSION")
-                version = cursor.fetchone()[0]
-                
-                cursor.execute("SELECT DB_NAME()")
-                current_db = cursor.fetchone()[0]
-                
+                version = cursor.execute("SELECT @@VERSION").fetchval()
+                current_db = cursor.execute("SELECT DB_NAME()").fetchval()
+
                 return {
                     "server": self.server,
                     "database": current_db,
                     "version": version,
                     "connection_string": self.connection_string
                 }
+            finally:
+                conn.close()
         except Exception as e:
             self.logger.error(f"Failed to get server info: {e}")
             return {
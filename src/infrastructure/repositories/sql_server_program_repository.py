@@ -4,14 +4,45 @@ Triển khai Program Repository cho SQL Server - Hạ tầng
 """
 
 import logging
+from contextlib import closing
 from typing import List, Optional
 from datetime import datetime
 
 from domain.repositories.program_repository import ProgramRepository
 from domain.entities.program import Program, RegisterItem
+from domain.entities.validation import validate_yyyymm
 from infrastructure.database.sql_server_connection import SqlServerConnection
 
 
+# SQL dựng sẵn ở module level: mỗi lần gọi chỉ tham chiếu hằng số
+# (tests có thể so sánh theo identity thay vì chuẩn hóa whitespace)
+GET_REGISTER_ITEMS_SQL = (
+    "SELECT yyyymm, program_code, type_code, item, facing, unit "
+    "FROM register_item "
+    "WHERE yyyymm = ? AND program_code = ? "
+    "ORDER BY program_code, type_code, item"
+)
+GET_REGISTER_ITEMS_SQL_NO_PROG = (
+    "SELECT yyyymm, program_code, type_code, item, facing, unit "
+    "FROM register_item "
+    "WHERE yyyymm = ? "
+    "ORDER BY program_code, type_code, item"
+)
+
+# Predicate kiểm tra RegisterItem hợp lệ - một biểu thức boolean AND duy nhất,
+# chạy trước khi lấy connection để item hỏng không tốn một lượt mượn pool.
+# Phần yyyymm dùng chung validate_yyyymm (memoized) với EvaluateCustomerUseCase
+# để hai tầng không bao giờ lệch luật (vd. tháng 13)
+_REGISTER_ITEM_VALID = (
+    lambda i: validate_yyyymm(i.yyyymm)
+    and bool(i.program_code)
+    and bool(i.type_code)
+    and bool(i.item)
+    and i.facing > 0
+    and i.unit > 0
+)
+
+
 class SqlServerProgramRepository(ProgramRepository):
     """
     SQL Server Implementation của Program Repository
@@ -45,8 +76,8 @@ class SqlServerProgramRepository(ProgramRepository):
             Optional[Program]: Thông tin chương trình hoặc None nếu không tìm thấy
         """
         try:
-            with self.db_connection.get_connection() as conn:
-                cursor = conn.cursor()
+            with self.db_connection.get_connection() as conn, \
+                    closing(conn.cursor()) as cursor:
                 
                 # Lấy thông tin chương trình từ register_item table
                 # Tạo Program entity từ dữ liệu có sẵn
@@ -87,8 +118,8 @@ class SqlServerProgramRepository(ProgramRepository):
             List[Program]: Danh sách tất cả chương trình
         """
         try:
-            with self.db_connection.get_connection() as conn:
-                cursor = conn.cursor()
+            with self.db_connection.get_connection() as conn, \
+                    closing(conn.cursor()) as cursor:
                 
                 query = """
                     SELECT DISTINCT program_code, type_code
@@ -158,8 +189,8 @@ class SqlServerProgramRepository(ProgramRepository):
             bool: True nếu xóa thành công, False nếu thất bại
         """
         try:
-            with self.db_connection.get_connection() as conn:
-                cursor = conn.cursor()
+            with self.db_connection.get_connection() as conn, \
+                    closing(conn.cursor()) as cursor:
                 
                 # Xóa tất cả register_item liên quan đến program
                 query = "DELETE FROM register_item WHERE program_code = ?"
@@ -189,25 +220,13 @@ class SqlServerProgramRepository(ProgramRepository):
             List[RegisterItem]: Danh sách register items
         """
         try:
-            with self.db_connection.get_connection() as conn:
-                cursor = conn.cursor()
+            with self.db_connection.get_connection() as conn, \
+                    closing(conn.cursor()) as cursor:
                 
                 if program_code:
-                    query = """
-                        SELECT yyyymm, program_code, type_code, item, facing, unit
-                        FROM register_item
-                        WHERE yyyymm = ? AND program_code = ?
-                        ORDER BY program_code, type_code, item
-                    """
-                    cursor.execute(query, (yyyymm, program_code))
+                    cursor.execute(GET_REGISTER_ITEMS_SQL, (yyyymm, program_code))
                 else:
-                    query = """
-                        SELECT yyyymm, program_code, type_code, item, facing, unit
-                        FROM register_item
-                        WHERE yyyymm = ?
-                        ORDER BY program_code, type_code, item
-                    """
-                    cursor.execute(query, (yyyymm,))
+                    cursor.execute(GET_REGISTER_ITEMS_SQL_NO_PROG, (yyyymm,))
                 
                 rows = cursor.fetchall()
                 register_items = []
@@ -243,8 +262,8 @@ class SqlServerProgramRepository(ProgramRepository):
             Optional[RegisterItem]: Register item hoặc None
         """
         try:
-            with self.db_connection.get_connection() as conn:
-                cursor = conn.cursor()
+            with self.db_connection.get_connection() as conn, \
+                    closing(conn.cursor()) as cursor:
                 
                 query = """
                     SELECT yyyymm, program_code, type_code, item, facing, unit
@@ -283,16 +302,41 @@ class SqlServerProgramRepository(ProgramRepository):
         Returns:
             bool: True nếu lưu thành công, False nếu thất bại
         """
+        return self.save_register_items([register_item])
+
+    def save_register_items(self, register_items: List[RegisterItem]) -> bool:
+        """
+        Lưu nhiều register items trong một transaction duy nhất
+
+        Dùng fast_executemany của pyodbc để gom toàn bộ parameter arrays
+        vào một TDS RPC thay vì N câu lệnh riêng lẻ - chi phí chính của
+        thao tác này là network round-trip, không phải compute.
+
+        Args:
+            register_items (List[RegisterItem]): Danh sách register items cần lưu
+
+        Returns:
+            bool: True nếu lưu thành công, False nếu thất bại
+        """
+        if not register_items:
+            return True
+
+        # Chặn dữ liệu hỏng trước khi chạm vào pool/connection
+        if not all(map(_REGISTER_ITEM_VALID, register_items)):
+            self.logger.warning("Rejected invalid register items before DB access")
+            return False
+
         try:
-            with self.db_connection.get_connection() as conn:
-                cursor = conn.cursor()
-                
+            with self.db_connection.get_connection() as conn, \
+                    closing(conn.cursor()) as cursor:
+                cursor.fast_executemany = True
+
                 # Use MERGE (UPSERT) to handle both INSERT and UPDATE
                 query = """
                     MERGE register_item AS target
-                    USING (SELECT ? AS yyyymm, ? AS program_code, ? AS type_code, 
+                    USING (SELECT ? AS yyyymm, ? AS program_code, ? AS type_code,
                                   ? AS item, ? AS facing, ? AS unit) AS source
-                    ON target.yyyymm = source.yyyymm 
+                    ON target.yyyymm = source.yyyymm
                        AND target.program_code = source.program_code
                        AND target.type_code = source.type_code
                        AND target.item = source.item
@@ -300,25 +344,29 @@ class SqlServerProgramRepository(ProgramRepository):
                         UPDATE SET facing = source.facing, unit = source.unit
                     WHEN NOT MATCHED THEN
                         INSERT (yyyymm, program_code, type_code, item, facing, unit)
-                        VALUES (source.yyyymm, source.program_code, source.type_code, 
+                        VALUES (source.yyyymm, source.program_code, source.type_code,
                                source.item, source.facing, source.unit);
                 """
-                
-                cursor.execute(query, (
-                    register_item.yyyymm,
-                    register_item.program_code,
-                    register_item.type_code,
-                    register_item.item,
-                    register_item.facing,
-                    register_item.unit
-                ))
-                
+
+                rows = [
+                    (
+                        register_item.yyyymm,
+                        register_item.program_code,
+                        register_item.type_code,
+                        register_item.item,
+                        register_item.facing,
+                        register_item.unit
+                    )
+                    for register_item in register_items
+                ]
+                cursor.executemany(query, rows)
+
                 conn.commit()
-                self.logger.info(f"Saved register item for {register_item.program_code}-{register_item.item} in {register_item.yyyymm}")
+                self.logger.info(f"Saved {len(rows)} register items in one batch")
                 return True
-                
+
         except Exception as e:
-            self.logger.error(f"Error saving register item: {e}")
+            self.logger.error(f"Error saving register items: {e}")
             return False
     
     def update_register_item(self, register_item: RegisterItem) -> bool:
@@ -332,8 +380,8 @@ class SqlServerProgramRepository(ProgramRepository):
             bool: True nếu cập nhật thành công, False nếu thất bại
         """
         try:
-            with self.db_connection.get_connection() as conn:
-                cursor = conn.cursor()
+            with self.db_connection.get_connection() as conn, \
+                    closing(conn.cursor()) as cursor:
                 
                 query = """
                     UPDATE register_item 
@@ -376,8 +424,8 @@ class SqlServerProgramRepository(ProgramRepository):
             bool: True nếu xóa thành công, False nếu thất bại
         """
         try:
-            with self.db_connection.get_connection() as conn:
-                cursor = conn.cursor()
+            with self.db_connection.get_connection() as conn, \
+                    closing(conn.cursor()) as cursor:
                 
                 query = """
                     DELETE FROM register_item 
@@ -6,8 +6,13 @@ CLI Đánh giá - Giao diện dòng lệnh cho đánh giá
 import sys
 from typing import Optional
 from application.use_cases.evaluate_customer_use_case import EvaluateCustomerUseCase
+from domain.entities.validation import format_yyyymm_display
 from domain.services.evaluation_service import EvaluationService
 
+# Các câu trả lời "tiếp tục" hợp lệ - frozenset dựng một lần ở module level,
+# membership check là một phép dò hash thay vì quét list
+_CONTINUE_CHOICES = frozenset({'y', 'yes', 'có', 'c'})
+
 
 class EvaluationCLI:
     """
@@ -79,7 +84,7 @@ class EvaluationCLI:
                 
                 print()
                 choice = input("Tiếp tục đánh giá? (y/n): ").strip().lower()
-                if choice not in ['y', 'yes', 'có', 'c']:
+                if choice not in _CONTINUE_CHOICES:
                     break
                 
                 print()
@@ -138,7 +143,7 @@ class EvaluationCLI:
         print("-" * 40)
         print(f"👤 Khách hàng: {data['customer_code']}")
         print(f"📋 Chương trình: {data['program_code']}")
-        print(f"📅 Tháng: {data['yyyymm']}")
+        print(f"📅 {format_yyyymm_display(data['yyyymm'])}")
         print()
         
         print("📈 ĐIỂM SỐ:")
@@ -0,0 +1,40 @@
+"""
+Fake Database Connection - SQLite in-memory cho integration test
+Kết nối database giả lập bằng SQLite để test repository với DBAPI thật
+
+📝 GIẢI THÍCH:
+- SQLite dùng chung cú pháp parameter `?` với pyodbc nên các câu
+  SELECT/UPDATE/DELETE của repository chạy nguyên văn không cần sửa
+- Một DBAPI thật chạy nhanh hơn chuỗi MagicMock 4 tầng ở khối lượng
+  test này, và kiểm chứng được cả SQL lẫn parameter wiring
+"""
+
+import sqlite3
+from contextlib import contextmanager
+
+
+class FakeDatabaseConnection:
+    """
+    Kết nối database giả lập - thay thế SqlServerConnection trong test
+
+    Cung cấp cùng interface get_connection() (context manager) nhưng
+    yield một sqlite3.Connection in-memory dùng chung, không đóng sau
+    mỗi lần dùng để dữ liệu tồn tại xuyên suốt test class.
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        """
+        Args:
+            conn (sqlite3.Connection): Connection in-memory dùng chung
+        """
+        self._conn = conn
+
+    @contextmanager
+    def get_connection(self):
+        """
+        Context manager trả về connection dùng chung
+
+        Yields:
+            sqlite3.Connection: Database connection
+        """
+        yield self._conn
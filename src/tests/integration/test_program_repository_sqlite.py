@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Integration Tests - SqlServerProgramRepository trên SQLite in-memory
+Test repository với DBAPI thật thay vì mock
+
+📝 GIẢI THÍCH:
+- Các test get/update/delete kiểm tra SQL + parameter wiring; chạy trên
+  sqlite3 :memory: vừa nhanh hơn chuỗi mock nhiều tầng vừa bắt được lỗi
+  SQL thật (sai tên cột, sai số parameter)
+- save_register_items dùng MERGE (cú pháp riêng của SQL Server) nên không
+  test được trên SQLite - phần đó đã có unit test mock ở tests/unit
+- Chạy: py -m pytest src/tests/integration/test_program_repository_sqlite.py
+"""
+
+import sys
+import os
+import sqlite3
+import unittest
+
+# Thêm src vào Python path để có thể import các module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from domain.entities.program import RegisterItem
+from infrastructure.repositories.sql_server_program_repository import SqlServerProgramRepository
+from tests.integration.fake_db import FakeDatabaseConnection
+
+CREATE_REGISTER_ITEM_TABLE = (
+    "CREATE TABLE register_item("
+    "yyyymm INT, program_code TEXT, type_code TEXT, item TEXT, "
+    "facing INT, unit INT, "
+    "PRIMARY KEY(yyyymm, program_code, type_code, item))"
+)
+
+SEED_ROWS = [
+    (202509, "PROG001", "TYPE_BEVERAGE", "KE_3_O", 4, 3),
+    (202509, "PROG001", "TYPE_BEVERAGE", "KE_4_O", 5, 4),
+    (202509, "PROG002", "TYPE_SNACK", "KE_3_O", 2, 1),
+]
+
+
+class TestProgramRepositorySqlite(unittest.TestCase):
+    """
+    Test SqlServerProgramRepository trên database SQLite thật
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """Tạo schema một lần cho cả class - connection dùng chung"""
+        cls._conn = sqlite3.connect(":memory:")
+        cls._conn.execute(CREATE_REGISTER_ITEM_TABLE)
+        cls.repo = SqlServerProgramRepository(FakeDatabaseConnection(cls._conn))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._conn.close()
+
+    def setUp(self):
+        """Reset dữ liệu về bộ seed chuẩn trước mỗi test"""
+        self._conn.execute("DELETE FROM register_item")
+        self._conn.executemany(
+            "INSERT INTO register_item VALUES (?, ?, ?, ?, ?, ?)", SEED_ROWS
+        )
+        self._conn.commit()
+
+    def test_get_register_items_filters_by_program(self):
+        """SELECT lọc đúng theo yyyymm + program_code và map thành entities"""
+        items = self.repo.get_register_items(202509, "PROG001")
+
+        self.assertEqual(items, [
+            RegisterItem(202509, "PROG001", "TYPE_BEVERAGE", "KE_3_O", 4, 3),
+            RegisterItem(202509, "PROG001", "TYPE_BEVERAGE", "KE_4_O", 5, 4),
+        ])
+
+    def test_get_register_items_all_programs(self):
+        """Không truyền program_code trả về mọi chương trình trong tháng"""
+        items = self.repo.get_register_items(202509)
+        self.assertEqual(len(items), 3)
+
+    def test_update_register_item_persists(self):
+        """UPDATE ghi facing/unit mới xuống database thật"""
+        updated = RegisterItem(202509, "PROG001", "TYPE_BEVERAGE", "KE_3_O", 7, 6)
+
+        self.assertTrue(self.repo.update_register_item(updated))
+
+        row = self._conn.execute(
+            "SELECT facing, unit FROM register_item "
+            "WHERE yyyymm = 202509 AND program_code = 'PROG001' AND item = 'KE_3_O'"
+        ).fetchone()
+        self.assertEqual(row, (7, 6))
+
+    def test_update_register_item_not_found(self):
+        """UPDATE không khớp hàng nào trả về False"""
+        missing = RegisterItem(202510, "PROG999", "TYPE_BEVERAGE", "KE_3_O", 1, 1)
+        self.assertFalse(self.repo.update_register_item(missing))
+
+    def test_delete_register_item_persists(self):
+        """DELETE xóa đúng một hàng khỏi database thật"""
+        self.assertTrue(
+            self.repo.delete_register_item(202509, "PROG001", "TYPE_BEVERAGE", "KE_3_O")
+        )
+
+        count = self._conn.execute(
+            "SELECT COUNT(*) FROM register_item"
+        ).fetchone()[0]
+        self.assertEqual(count, 2)
+
+    def test_delete_register_item_not_found(self):
+        """DELETE không khớp hàng nào trả về False"""
+        self.assertFalse(
+            self.repo.delete_register_item(202510, "PROG999", "TYPE_X", "KE_9_O")
+        )
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-q"]))
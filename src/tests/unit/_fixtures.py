@@ -0,0 +1,47 @@
+"""
+Unit Test Fixtures - Mock helpers dùng chung
+Helper dựng mock database connection cho các unit test
+
+📝 GIẢI THÍCH:
+- Việc dựng chuỗi mock conn/cursor/context-manager lặp lại trong mỗi setUp
+  khá tốn kém (Mock construction + introspection); gom về một chỗ để
+  các test class dùng chung một đường dựng duy nhất
+"""
+
+from unittest.mock import MagicMock, Mock
+
+from infrastructure.database.sql_server_connection import SqlServerConnection
+
+
+def make_mock_conn():
+    """
+    Tạo cặp (mock_conn, mock_cursor) đã nối sẵn
+
+    Returns:
+        tuple: (mock_conn, mock_cursor) với mock_conn.cursor() -> mock_cursor
+    """
+    mock_conn = Mock()
+    mock_cursor = Mock()
+    mock_conn.cursor.return_value = mock_cursor
+    return mock_conn, mock_cursor
+
+
+def make_mock_db():
+    """
+    Tạo bộ (mock_db, mock_conn, mock_cursor) đã nối sẵn context manager
+
+    Returns:
+        tuple: (mock_db, mock_conn, mock_cursor) với
+               mock_db.get_connection() hoạt động như context manager
+               trả về mock_conn
+    """
+    mock_conn, mock_cursor = make_mock_conn()
+    # spec_set: gán nhầm attribute không tồn tại trên SqlServerConnection
+    # sẽ fail ngay thay vì lặng lẽ tạo child mock mới
+    mock_db = Mock(spec_set=SqlServerConnection)
+
+    context_manager = MagicMock()
+    context_manager.__enter__.return_value = mock_conn
+    mock_db.get_connection.return_value = context_manager
+
+    return mock_db, mock_conn, mock_cursor
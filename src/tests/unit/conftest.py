@@ -0,0 +1,30 @@
+"""
+Unit Test Configuration - Shared pytest fixtures
+Cấu hình pytest dùng chung cho unit tests
+
+📝 GIẢI THÍCH:
+- Fixture scope="session" chạy đúng một lần cho cả lần chạy test
+  (mỗi worker một lần khi chạy song song với pytest-xdist)
+"""
+
+import sys
+import os
+
+import pytest
+from unittest.mock import create_autospec
+
+# Thêm src vào Python path để có thể import các module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from infrastructure.database.sql_server_connection import SqlServerConnection
+
+
+@pytest.fixture(scope="session")
+def mock_db_template():
+    """
+    Autospec SqlServerConnection dùng chung cho cả session
+
+    Spec introspection (duyệt attribute tree của class) chỉ chạy một lần;
+    test cần instance riêng thì copy từ template này.
+    """
+    return create_autospec(SqlServerConnection, instance=True)
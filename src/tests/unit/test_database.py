@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Database Unit Tests - SqlServerConnection
+Unit test cho lớp kết nối database
+
+📝 GIẢI THÍCH:
+- Các test này mock pyodbc nên không cần SQL Server thật
+- Chạy: py -m pytest src/tests/unit/test_database.py
+"""
+
+import gc
+import sys
+import os
+import re
+import unittest
+from unittest.mock import Mock, patch
+
+import pyodbc
+
+# Thêm src vào Python path để có thể import các module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from domain.entities.program import RegisterItem
+from infrastructure.database.sql_server_connection import SqlServerConnection
+from infrastructure.repositories.sql_server_program_repository import (
+    GET_REGISTER_ITEMS_SQL,
+    SqlServerProgramRepository,
+)
+from tests.unit._fixtures import make_mock_conn, make_mock_db
+
+# Regex chuẩn hóa whitespace compile một lần, dùng cho các phép so sánh SQL
+# chưa được lift thành hằng số module-level
+_WS = re.compile(r"\s+")
+
+# Pattern kiểm tra connection string compile một lần ở module level:
+# một lượt quét regex thay cho chuỗi assertIn quét lại chuỗi từ đầu mỗi lần
+_SQL_AUTH_CS_RE = re.compile(
+    r"DRIVER=\{ODBC Driver 17 for SQL Server\};"
+    r"SERVER=server1;DATABASE=db1;UID=user1;PWD=pass1;"
+)
+_TRUSTED_CS_RE = re.compile(
+    r"DRIVER=\{ODBC Driver 17 for SQL Server\};"
+    r"SERVER=server1;DATABASE=db1;Trusted_Connection=yes;"
+)
+
+
+class TestSqlServerConnection(unittest.TestCase):
+    """
+    Test SqlServerConnection - Kết nối và connection pool
+    """
+
+    def setUp(self):
+        """Chuẩn bị connection với thông số test"""
+        self.db = SqlServerConnection(
+            server="server1",
+            database="db1",
+            username="user1",
+            password="pass1"
+        )
+
+    def tearDown(self):
+        """Xả pool sau mỗi test để các test không chia sẻ connection mock"""
+        SqlServerConnection._pools.clear()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Thu dọn MagicMock tích lũy để test class sau không trả phí GC gen-2"""
+        gc.collect()
+
+    def test_build_connection_string_sql_auth(self):
+        """Connection string với SQL authentication"""
+        self.assertRegex(self.db.connection_string, _SQL_AUTH_CS_RE)
+
+    def test_build_connection_string_trusted(self):
+        """Connection string với Windows authentication"""
+        db = SqlServerConnection(server="server1", database="db1", trusted_connection=True)
+        self.assertRegex(db.connection_string, _TRUSTED_CS_RE)
+
+    @patch('infrastructure.database.sql_server_connection.pyodbc.connect')
+    def test_get_connection_returns_to_pool(self, mock_connect):
+        """Connection được trả về pool thay vì đóng, và được tái sử dụng"""
+        mock_conn = Mock()
+        mock_connect.return_value = mock_conn
+
+        with self.db.get_connection() as conn:
+            self.assertIs(conn, mock_conn)
+
+        # Không đóng connection khi thành công - rollback implicit transaction
+        # (pyodbc autocommit=False) rồi trả về pool
+        mock_conn.close.assert_not_called()
+        mock_conn.rollback.assert_called_once()
+
+        # Lần gọi thứ hai tái sử dụng connection từ pool, không connect lại
+        with self.db.get_connection() as conn:
+            self.assertIs(conn, mock_conn)
+
+        mock_connect.assert_called_once_with(self.db.connection_string)
+
+    @patch('infrastructure.database.sql_server_connection.pyodbc.connect')
+    def test_get_connection_drops_failed_connection(self, mock_connect):
+        """Connection gặp lỗi bị rollback, đóng hẳn và không trả về pool"""
+        mock_conn = Mock()
+        mock_connect.return_value = mock_conn
+
+        with self.assertRaises(RuntimeError):
+            with self.db.get_connection():
+                raise RuntimeError("query failed")
+
+        mock_conn.rollback.assert_called_once()
+        mock_conn.close.assert_called_once()
+
+        # Pool rỗng - lần gọi tiếp theo phải mở connection mới
+        with self.db.get_connection():
+            pass
+        self.assertEqual(mock_connect.call_count, 2)
+
+    @patch('infrastructure.database.sql_server_connection.pyodbc.connect')
+    def test_get_connection_drops_dead_pooled_connection(self, mock_connect):
+        """Connection chết trong lúc nằm pool bị probe loại bỏ, mở connection mới"""
+        dead_conn, live_conn = Mock(), Mock()
+        mock_connect.side_effect = [dead_conn, live_conn]
+
+        # Lượt đầu trả dead_conn về pool
+        with self.db.get_connection():
+            pass
+
+        # Server ngắt connection trong lúc nó nằm pool - probe SELECT 1 fail
+        dead_conn.cursor.side_effect = pyodbc.Error("connection is closed")
+
+        with self.db.get_connection() as conn:
+            self.assertIs(conn, live_conn)
+
+        dead_conn.close.assert_called_once()
+        self.assertEqual(mock_connect.call_count, 2)
+
+    @patch('infrastructure.database.sql_server_connection.pyodbc.connect')
+    def test_test_connection_uses_autocommit_probe(self, mock_connect):
+        """Probe SELECT 1 chạy trên connection autocommit và đóng sau khi dùng"""
+        mock_conn, mock_cursor = make_mock_conn()
+        mock_connect.return_value = mock_conn
+        mock_cursor.execute.return_value.fetchval.return_value = 1
+
+        self.assertTrue(self.db.test_connection())
+
+        mock_connect.assert_called_once_with(
+            self.db.connection_string, autocommit=True
+        )
+        mock_conn.close.assert_called_once()
+
+    @patch('infrastructure.database.sql_server_connection.pyodbc.connect')
+    def test_test_connection_failure(self, mock_connect):
+        """Lỗi kết nối trả về False thay vì raise"""
+        mock_connect.side_effect = Exception("server unreachable")
+        self.assertFalse(self.db.test_connection())
+
+
+class RepoTestBase(unittest.TestCase):
+    """
+    Base class chung cho các test class repository
+    """
+
+    def _assert_repo_wired(self, repo, db):
+        """Kiểm tra repository được nối db connection + logger bằng một phép so sánh tuple"""
+        self.assertEqual((repo.db_connection, repo.logger is not None), (db, True))
+
+
+class TestSqlServerProgramRepository(RepoTestBase):
+    """
+    Test SqlServerProgramRepository - Thao tác register_item
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """RegisterItem mẫu không bị test nào mutate - dựng một lần cho cả class"""
+        cls.sample_register_item = RegisterItem(
+            yyyymm=202509,
+            program_code="PROG001",
+            type_code="TYPE_BEVERAGE",
+            item="KE_3_O",
+            facing=4,
+            unit=3
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        """Thu dọn MagicMock tích lũy để test class sau không trả phí GC gen-2"""
+        gc.collect()
+
+    def setUp(self):
+        """Chuẩn bị mock database connection và repository"""
+        self.mock_db, self.mock_conn, self.mock_cursor = make_mock_db()
+        self.repo = SqlServerProgramRepository(self.mock_db)
+
+    def test_wiring(self):
+        """Repository giữ đúng db connection và có logger"""
+        self._assert_repo_wired(self.repo, self.mock_db)
+
+    def test_get_register_items_success(self):
+        """Query register items đúng SQL và map rows thành entities"""
+        self.mock_cursor.fetchall.return_value = [
+            (202509, "PROG001", "TYPE_BEVERAGE", "KE_3_O", 4, 3)
+        ]
+
+        items = self.repo.get_register_items(202509, "PROG001")
+
+        self.assertEqual(items, [self.sample_register_item])
+        args = self.mock_cursor.execute.call_args[0]
+        # So sánh identity: repository phải dùng đúng hằng số SQL module-level
+        self.assertIs(args[0], GET_REGISTER_ITEMS_SQL)
+        self.assertEqual(args[1], (202509, "PROG001"))
+
+    def test_save_register_items_batch(self):
+        """Batch save dùng một executemany + một commit cho cả danh sách"""
+        other_item = RegisterItem(
+            yyyymm=202509,
+            program_code="PROG001",
+            type_code="TYPE_BEVERAGE",
+            item="KE_4_O",
+            facing=5,
+            unit=4
+        )
+
+        # Bind một lần: mỗi lần đi qua MagicMock.__getattr__ đều tốn lookup
+        executemany = self.mock_cursor.executemany
+        commit = self.mock_conn.commit
+
+        result = self.repo.save_register_items([self.sample_register_item, other_item])
+
+        self.assertTrue(result)
+        self.assertTrue(self.mock_cursor.fast_executemany)
+        executemany.assert_called_once()
+        rows = executemany.call_args[0][1]
+        self.assertEqual(rows, [
+            (202509, "PROG001", "TYPE_BEVERAGE", "KE_3_O", 4, 3),
+            (202509, "PROG001", "TYPE_BEVERAGE", "KE_4_O", 5, 4),
+        ])
+        commit.assert_called_once()
+
+    def test_save_register_item_delegates_to_batch(self):
+        """Save đơn lẻ đi qua cùng đường batch (một hàng)"""
+        executemany = self.mock_cursor.executemany
+        commit = self.mock_conn.commit
+
+        result = self.repo.save_register_item(self.sample_register_item)
+
+        self.assertTrue(result)
+        executemany.assert_called_once()
+        rows = executemany.call_args[0][1]
+        self.assertEqual(rows, [(202509, "PROG001", "TYPE_BEVERAGE", "KE_3_O", 4, 3)])
+        commit.assert_called_once()
+
+    def test_crud_success(self):
+        """Update/delete chia sẻ chung một bộ mock, assert thẳng không qua subTest"""
+        cases = [
+            (
+                "update",
+                self.repo.update_register_item,
+                (self.sample_register_item,),
+                "UPDATE register_item",
+                (4, 3, 202509, "PROG001", "TYPE_BEVERAGE", "KE_3_O")
+            ),
+            (
+                "delete",
+                self.repo.delete_register_item,
+                (202509, "PROG001", "TYPE_BEVERAGE", "KE_3_O"),
+                "DELETE FROM register_item",
+                (202509, "PROG001", "TYPE_BEVERAGE", "KE_3_O")
+            ),
+        ]
+
+        execute = self.mock_cursor.execute
+        commit = self.mock_conn.commit
+
+        # Không bọc subTest: mỗi vòng chỉ có vài assertion O(1), chi phí
+        # __enter__/__exit__ của subTest lấn át; msg=name vẫn chỉ ra case hỏng
+        for name, fn, args, sql_fragment, params in cases:
+            self.mock_cursor.reset_mock()
+            self.mock_conn.reset_mock()
+            self.mock_cursor.rowcount = 1
+
+            self.assertTrue(fn(*args), msg=name)
+
+            call_args = execute.call_args[0]
+            self.assertIn(sql_fragment, call_args[0], msg=name)
+            self.assertEqual(call_args[1], params, msg=name)
+            commit.assert_called_once()
+
+    def test_save_register_items_empty_list(self):
+        """Danh sách rỗng không mở connection"""
+        self.assertTrue(self.repo.save_register_items([]))
+        self.mock_db.get_connection.assert_not_called()
+
+    def test_save_register_item_invalid_data(self):
+        """Item không hợp lệ bị chặn trước khi lấy connection"""
+        invalid_item = RegisterItem(
+            yyyymm=202509,
+            program_code="PROG001",
+            type_code="TYPE_BEVERAGE",
+            item="KE_3_O",
+            facing=0,
+            unit=3
+        )
+
+        self.assertFalse(self.repo.save_register_item(invalid_item))
+        self.mock_db.get_connection.assert_not_called()
+
+    def test_save_register_item_invalid_month(self):
+        """yyyymm tháng 13 bị validate_yyyymm chặn như ở tầng use case"""
+        bad_month_item = RegisterItem(
+            yyyymm=202513,
+            program_code="PROG001",
+            type_code="TYPE_BEVERAGE",
+            item="KE_3_O",
+            facing=4,
+            unit=3
+        )
+
+        self.assertFalse(self.repo.save_register_item(bad_month_item))
+        self.mock_db.get_connection.assert_not_called()
+
+
+if __name__ == "__main__":
+    # Chạy qua pytest để có thể thêm -n auto (pytest-xdist) khi cần song song;
+    # các test class ở đây không chia sẻ state module-level nên xdist-safe
+    import pytest
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Model Unit Tests - Domain Entities
+Unit test cho các entity tầng domain, viết theo kiểu pytest
+
+📝 GIẢI THÍCH:
+- Dùng hàm module-level + @pytest.mark.parametrize thay cho
+  unittest.TestCase + subTest: mỗi case là một test node độc lập,
+  filter được với -k và chạy song song được với pytest-xdist
+- Fixture scope="module": entity bất biến chỉ dựng một lần cho cả file
+- Chạy: py -m pytest src/tests/unit/test_models.py
+"""
+
+import sys
+import os
+import re
+
+import pytest
+
+# Thêm src vào Python path để có thể import các module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from datetime import datetime
+
+from domain.entities.program import RegisterItem
+from domain.entities.registration import Registration
+from domain.entities.evaluation import (
+    AuditPicture,
+    ConditionGroup,
+    ConditionItem,
+    CustomerEvaluationResult,
+)
+from domain.entities.validation import (
+    format_yyyymm_display,
+    validate_yyyymm,
+    validate_yyyymm_batch,
+)
+
+
+# Ngày audit cố định dựng một lần: datetime construction không rẻ và
+# timestamp cố định giữ test deterministic (như FIXED_DT ở test suite chính)
+FIXED_AUDIT_DATE = datetime(2025, 9, 15, 10, 30)
+
+
+# ============================================================================
+# FIXTURES - Entity mẫu dựng một lần cho cả module
+# ============================================================================
+
+@pytest.fixture(scope="module")
+def register_item():
+    """RegisterItem mẫu - các test chỉ đọc, không mutate"""
+    return RegisterItem(202509, "PROG001", "TYPE_BEVERAGE", "KE_3_O", 4, 3)
+
+
+@pytest.fixture(scope="module")
+def condition_group():
+    """ConditionGroup mẫu"""
+    return ConditionGroup(202509, "PROG001", 1, "TYPE_BEVERAGE", 10)
+
+
+@pytest.fixture(scope="module")
+def condition_item():
+    """ConditionItem mẫu với ngưỡng tối thiểu 80"""
+    return ConditionItem(202509, "PROG001", 1, "COND001", 80, 5)
+
+
+@pytest.fixture(scope="module")
+def passing_result():
+    """Kết quả đánh giá đạt chuẩn và còn đăng ký active"""
+    return CustomerEvaluationResult(
+        yyyymm=202509,
+        customer_code="CUST001",
+        program_code="PROG001",
+        total_points=15,
+        max_possible_points=20,
+        meets_criteria=True,
+        failed_conditions=[],
+        registration_status=True
+    )
+
+
+# ============================================================================
+# REGISTER ITEM
+# ============================================================================
+
+# Entity bất biến dựng một lần ở module level: các test chỉ đọc nên
+# không cần construct lại trong từng test body
+_SAME_KEY_ITEM = RegisterItem(202509, "PROG001", "TYPE_BEVERAGE", "KE_3_O", 9, 9)
+_SAME_KEY_GROUP = ConditionGroup(202509, "PROG001", 1, "TYPE_SNACK", 99)
+
+
+def test_register_item_equality_by_key(register_item):
+    """Equality so theo khóa (yyyymm, program, type, item) - không theo số lượng"""
+    assert register_item == _SAME_KEY_ITEM
+    assert hash(register_item) == hash(_SAME_KEY_ITEM)
+
+
+@pytest.mark.parametrize("other", [
+    RegisterItem(202510, "PROG001", "TYPE_BEVERAGE", "KE_3_O", 4, 3),
+    RegisterItem(202509, "PROG002", "TYPE_BEVERAGE", "KE_3_O", 4, 3),
+    RegisterItem(202509, "PROG001", "TYPE_SNACK", "KE_3_O", 4, 3),
+    RegisterItem(202509, "PROG001", "TYPE_BEVERAGE", "KE_4_O", 4, 3),
+], ids=["yyyymm", "program_code", "type_code", "item"])
+def test_register_item_inequality(register_item, other):
+    """Khác bất kỳ trường khóa nào là hai item khác nhau"""
+    assert register_item != other
+
+
+def test_register_item_not_equal_to_other_type(register_item):
+    """So sánh với object khác loại trả về False thay vì raise"""
+    assert register_item != "KE_3_O"
+
+
+# ============================================================================
+# REGISTRATION
+# ============================================================================
+
+def _make_registration(status: bool) -> Registration:
+    """Registration dựng mới mỗi lần gọi - các test activate/deactivate mutate"""
+    return Registration(202509, "PROG001", "CUST001", "KE_3_O", 1, status)
+
+
+def test_registration_activate():
+    """activate bật status và đóng dấu updated_at"""
+    registration = _make_registration(status=False)
+    registration.activate()
+    assert registration.is_active
+    assert registration.updated_at is not None
+
+
+def test_registration_deactivate():
+    """deactivate tắt status"""
+    registration = _make_registration(status=True)
+    registration.deactivate()
+    assert registration.is_inactive
+
+
+# ============================================================================
+# CONDITION GROUP / CONDITION ITEM
+# ============================================================================
+
+def test_condition_group_equality_by_key(condition_group):
+    """Equality so theo (yyyymm, program, group) - không theo điểm"""
+    assert condition_group == _SAME_KEY_GROUP
+    assert hash(condition_group) == hash(_SAME_KEY_GROUP)
+
+
+@pytest.mark.parametrize("value,expected", [
+    (85, True),
+    (80, True),
+    (79, False),
+    (0, False),
+], ids=["above", "boundary", "below", "zero"])
+def test_condition_item_meets_minimum(condition_item, value, expected):
+    """meets_minimum so sánh >= với condition_min_value"""
+    assert condition_item.meets_minimum(value) is expected
+
+
+# ============================================================================
+# AUDIT PICTURE
+# ============================================================================
+
+# Bảng case ở module level: pytest collect một lần, mỗi case một test node
+NUMERIC_CASES = (
+    ("85", 85),
+    ("0", 0),
+    ("100", 100),
+    ("-5", -5),
+    ("85.7", 85),
+)
+INVALID_NUMERIC_VALUES = ("abc", "", "8 5")
+
+
+@pytest.fixture(scope="module")
+def make_audit():
+    """Factory dựng AuditPicture chỉ khác nhau ở value"""
+    return lambda v: AuditPicture(202509, "CUST001", "COND001", v, FIXED_AUDIT_DATE)
+
+
+@pytest.mark.parametrize("value_str,expected", NUMERIC_CASES)
+def test_audit_picture_numeric_value(make_audit, value_str, expected):
+    """value dạng chuỗi số chuyển được sang int"""
+    assert make_audit(value_str).numeric_value == expected
+
+
+@pytest.mark.parametrize("value_str", INVALID_NUMERIC_VALUES)
+def test_audit_picture_numeric_value_invalid(make_audit, value_str):
+    """value không phải số nguyên raise ValueError"""
+    with pytest.raises(ValueError):
+        make_audit(value_str).numeric_value
+
+
+# ============================================================================
+# CUSTOMER EVALUATION RESULT
+# ============================================================================
+
+# Một pattern compile sẵn quét chuỗi đúng một lượt thay cho chuỗi assertIn
+# (mỗi assertIn là một lần str.find quét lại từ đầu)
+_RESULT_STR_RE = re.compile(r"CUST001-PROG001.*15/20 points.*\bELIGIBLE\b")
+
+
+def test_result_str_shows_eligibility(passing_result):
+    """__str__ hiển thị khách hàng, điểm số và trạng thái ELIGIBLE"""
+    assert _RESULT_STR_RE.search(str(passing_result))
+
+
+# (result, expected) dựng sẵn lúc import: mỗi test node chỉ còn đọc thuộc tính
+ELIGIBILITY_CASES = [
+    (CustomerEvaluationResult(202509, "CUST001", "PROG001", 10, 20,
+                              meets, [], status), expected)
+    for meets, status, expected in [
+        (True, True, True),
+        (True, False, False),
+        (False, True, False),
+        (False, False, False),
+    ]
+]
+
+
+@pytest.mark.parametrize(
+    "result,expected", ELIGIBILITY_CASES,
+    ids=["both", "inactive_registration", "criteria_failed", "neither"]
+)
+def test_result_is_eligible_for_reward(result, expected):
+    """Chỉ đủ điều kiện thưởng khi đạt tiêu chí VÀ đăng ký còn active"""
+    assert result.is_eligible_for_reward is expected
+
+
+# Bảng (result, expected) dựng sẵn một lần lúc import như ELIGIBILITY_CASES
+SUCCESS_RATE_CASES = tuple(
+    (CustomerEvaluationResult(202509, "CUST001", "PROG001",
+                              total, maximum, False, [], True), expected)
+    for total, maximum, expected in [
+        (15, 20, 75.0),
+        (20, 20, 100.0),
+        (0, 20, 0.0),
+        (5, 0, 0.0),
+    ]
+)
+
+
+@pytest.mark.parametrize(
+    "result,expected", SUCCESS_RATE_CASES,
+    ids=["partial", "full", "none", "zero_max"]
+)
+def test_result_success_rate(result, expected):
+    """success_rate trả về phần trăm, max = 0 không chia cho 0"""
+    assert result.success_rate == expected
+
+
+@pytest.mark.parametrize("failed,expected", [
+    ([], "No failures"),
+    (["COND001"], "Failed: COND001"),
+    (["C1", "C2"], "Failed 2 conditions: C1, C2"),
+    (["C1", "C2", "C3", "C4"], "Failed 4 conditions: C1, C2, C3..."),
+], ids=["none", "single", "two", "truncated"])
+def test_result_get_failure_summary(failed, expected):
+    """Tóm tắt thất bại: rỗng, một, nhiều và cắt ngắn sau 3 điều kiện"""
+    result = CustomerEvaluationResult(
+        202509, "CUST001", "PROG001", 0, 20, False, failed, True
+    )
+    assert result.get_failure_summary() == expected
+
+
+# ============================================================================
+# VALIDATION HELPERS
+# ============================================================================
+
+# Bảng case + oracle frozenset: tập giá trị hợp lệ kỳ vọng so sánh được
+# bằng một phép set-equality C-level
+YYYYMM_CASES = (
+    (202001, True),
+    (202509, True),
+    (999912, True),
+    (201912, False),
+    (202000, False),
+    (202013, False),
+    (999913, False),
+    (1000001, False),
+)
+_VALID_YYYYMM_ORACLE = frozenset(v for v, ok in YYYYMM_CASES if ok)
+
+
+@pytest.mark.parametrize("yyyymm,expected", YYYYMM_CASES)
+def test_validate_yyyymm(yyyymm, expected):
+    """Khoảng hợp lệ 202001-999912 và phần tháng phải là 01-12"""
+    assert validate_yyyymm(yyyymm) is expected
+
+
+def test_validate_yyyymm_oracle():
+    """Meta-test: lọc bảng case qua validator ra đúng tập oracle"""
+    accepted = frozenset(v for v, _ in YYYYMM_CASES if validate_yyyymm(v))
+    assert accepted == _VALID_YYYYMM_ORACLE
+
+
+@pytest.mark.parametrize("yyyymm,expected", [
+    (202509, "Tháng 09/2025"),
+    (202512, "Tháng 12/2025"),
+    (202013, "202013"),
+], ids=["padded_month", "december", "invalid_passthrough"])
+def test_format_yyyymm_display(yyyymm, expected):
+    """Format hiển thị Tháng MM/YYYY; giá trị không hợp lệ giữ nguyên trạng"""
+    assert format_yyyymm_display(yyyymm) == expected
+
+
+def test_validate_yyyymm_batch_matches_scalar():
+    """Bản batch numpy cho cùng kết quả với validator scalar trên cả bảng case"""
+    import numpy as np
+
+    values = np.array([v for v, _ in YYYYMM_CASES])
+    expected = np.array([ok for _, ok in YYYYMM_CASES])
+    np.testing.assert_array_equal(validate_yyyymm_batch(values), expected)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
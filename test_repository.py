@@ -1,50 +1,63 @@
 #!/usr/bin/env python3
 """
-Test script to verify SqlServerEvaluationRepository implementation
+Repository Smoke Tests - SqlServerEvaluationRepository
+Test kiểm tra nhanh SqlServerEvaluationRepository
+
+📝 GIẢI THÍCH:
+- Viết dạng pytest thay vì script chạy lúc import: find_spec kiểm tra
+  module tồn tại mà không thực thi module body (không load pyodbc),
+  phần instantiation gom vào fixture scope="session" chỉ dựng một lần
+- Chạy: py -m pytest test_repository.py
 """
 
 import sys
 import os
+import importlib.util
+
+import pytest
 
 # Add src to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-try:
-    # Test imports
-    print("Testing imports...")
-    
+_REQUIRED_MODULES = (
+    "infrastructure.database.sql_server_connection",
+    "infrastructure.repositories.sql_server_evaluation_repository",
+    "domain.repositories.evaluation_repository",
+    "domain.entities.evaluation",
+)
+
+
+@pytest.fixture(scope="session")
+def evaluation_repository():
+    """Repository dựng một lần cho cả session - không mở kết nối nào"""
     from infrastructure.database.sql_server_connection import SqlServerConnection
-    print("✅ SqlServerConnection imported successfully")
-    
-    from infrastructure.repositories.sql_server_evaluation_repository import SqlServerEvaluationRepository
-    print("✅ SqlServerEvaluationRepository imported successfully")
-    
+    from infrastructure.repositories.sql_server_evaluation_repository import (
+        SqlServerEvaluationRepository,
+    )
+    return SqlServerEvaluationRepository(SqlServerConnection())
+
+
+@pytest.mark.parametrize("module_name", _REQUIRED_MODULES)
+def test_repository_modules_exist(module_name):
+    """Các module hạ tầng/domain tồn tại (find_spec - không chạy module body)"""
+    assert importlib.util.find_spec(module_name) is not None
+
+
+def test_repository_implements_interface(evaluation_repository):
+    """SqlServerEvaluationRepository implement đúng interface domain"""
+    from domain.repositories.evaluation_repository import EvaluationRepository
+    assert isinstance(evaluation_repository, EvaluationRepository)
+
+
+def test_repository_has_no_abstract_gaps(evaluation_repository):
+    """Mọi abstract method của interface đều đã được implement"""
     from domain.repositories.evaluation_repository import EvaluationRepository
-    print("✅ EvaluationRepository interface imported successfully")
-    
-    from domain.entities.evaluation import ConditionGroup, ConditionItem, AuditPicture, CustomerEvaluationResult
-    print("✅ Evaluation entities imported successfully")
-    
-    # Test instantiation
-    print("\nTesting instantiation...")
-    
-    # Create database connection
-    db_connection = SqlServerConnection()
-    print("✅ SqlServerConnection instantiated successfully")
-    
-    # Create repository
-    repository = SqlServerEvaluationRepository(db_connection)
-    print("✅ SqlServerEvaluationRepository instantiated successfully")
-    
-    # Test that it implements the interface
-    assert isinstance(repository, EvaluationRepository)
-    print("✅ SqlServerEvaluationRepository implements EvaluationRepository interface")
-    
-    print("\n🎉 All tests passed! SqlServerEvaluationRepository is working correctly.")
-    
-except ImportError as e:
-    print(f"❌ Import error: {e}")
-    sys.exit(1)
-except Exception as e:
-    print(f"❌ Error: {e}")
-    sys.exit(1)
+    missing = [
+        name for name in EvaluationRepository.__abstractmethods__
+        if not callable(getattr(evaluation_repository, name, None))
+    ]
+    assert missing == []
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -5,94 +5,214 @@ Verify SqlServerEvaluationRepository Implementation
 
 import sys
 import os
+import importlib.util
+from functools import lru_cache
 
-# Add src to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+# Đường dẫn src tính sẵn một lần; chỉ chèn vào sys.path khi chạy như script.
+# Import module này (vd. test runner đã có pythonpath=src) không mutate sys.path
+_SRC_DIR = os.path.join(os.path.dirname(__file__), 'src')
 
-def verify_imports():
-    """Verify all imports work correctly"""
+def _emit(lines):
+    """
+    Ghi cả buffer thông báo thành công bằng một lần write
+
+    Mỗi print là một syscall + flush; gom thông báo của từng verify_*
+    rồi ghi một lượt. Đặt VERIFY_QUIET=1 để tắt hẳn chatter (CI/pipe)
+    - thông báo lỗi ❌ vẫn print trực tiếp, không qua buffer này.
+    """
+    if not os.environ.get("VERIFY_QUIET"):
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def cached_import(module_path, class_name):
+    """
+    Import lười một class theo (module, tên), ưu tiên sys.modules
+
+    Mỗi verify_* chỉ import đúng module nó cần tại thời điểm chạy;
+    module đã load được lấy thẳng từ sys.modules (một phép tra dict)
+    thay vì đi lại qua import machinery. Guard _initializing xử lý
+    trường hợp module đang import dở (circular/partial import).
+    """
+    modules = sys.modules
+    if module_path not in modules or (
+        getattr(modules[module_path], "__spec__", None) is not None
+        and getattr(modules[module_path].__spec__, "_initializing", False) is True
+    ):
+        importlib.import_module(module_path)
+    return getattr(modules[module_path], class_name)
+
+
+@lru_cache(maxsize=1)
+def _build_repository():
+    """
+    Dựng (một lần duy nhất) repository với database connection
+
+    verify_instantiation và verify_methods dùng chung một instance:
+    chi phí constructor chỉ trả một lần cho cả lượt verify.
+    """
+    SqlServerConnection = cached_import(
+        "infrastructure.database.sql_server_connection", "SqlServerConnection"
+    )
+    SqlServerEvaluationRepository = cached_import(
+        "infrastructure.repositories.sql_server_evaluation_repository",
+        "SqlServerEvaluationRepository"
+    )
+    return SqlServerEvaluationRepository(SqlServerConnection())
+
+
+# Fallback khi interface không khai báo abstract method nào (không xảy ra
+# với EvaluationRepository hiện tại, nhưng giữ danh sách làm lưới an toàn).
+# Tuple hằng + sys.intern: tên method trong class dict đã được CPython
+# intern, nên các phép so khớp sau đó đi đường pointer-equality
+_REQUIRED_FALLBACK = tuple(sys.intern(s) for s in (
+    'get_condition_groups',
+    'get_condition_group_by_id',
+    'get_condition_items_by_group',
+    'get_condition_items',
+    'get_audit_results',
+    'get_audit_result',
+    'save_audit_result',
+    'save_evaluation_result',
+    'get_evaluation_result',
+))
+
+
+@lru_cache(maxsize=1)
+def _required_methods():
+    """
+    Tập method bắt buộc, đọc từ interface đúng một lần
+
+    Interface đã tự theo dõi các tên bắt buộc qua __abstractmethods__;
+    đọc một lần vào frozenset (tên intern sẵn) thay vì hardcode lại
+    danh sách mỗi lần gọi.
+    """
+    EvaluationRepository = cached_import(
+        "domain.repositories.evaluation_repository", "EvaluationRepository"
+    )
+    return (frozenset(map(sys.intern, EvaluationRepository.__abstractmethods__))
+            or frozenset(_REQUIRED_FALLBACK))
+
+# Bốn module cốt lõi mà phần còn lại của script phụ thuộc vào
+_CORE_MODULES = (
+    "domain.entities.evaluation",
+    "domain.repositories.evaluation_repository",
+    "infrastructure.database.sql_server_connection",
+    "infrastructure.repositories.sql_server_evaluation_repository",
+)
+
+
+@lru_cache(maxsize=1)
+def _import_core():
+    """
+    Probe rồi import toàn bộ module cốt lõi, đúng một lần (memoized)
+
+    find_spec trả lời "có importable không" mà không dựng ImportError
+    + traceback cho đường thiếu module; chỉ sau khi cả bốn probe đều
+    đạt mới import thật. try/except chỉ còn là lưới an toàn cho
+    dependency bắc cầu (vd. pyodbc) thiếu lúc thực thi module.
+
+    Returns:
+        ImportError mô tả module thiếu/hỏng, hoặc None nếu import sạch
+    """
+    for mod in _CORE_MODULES:
+        if importlib.util.find_spec(mod) is None:
+            return ImportError(f"No module named '{mod}'")
     try:
-        print("🔍 Testing imports...")
-        
-        # Test domain imports
-        from domain.entities.evaluation import ConditionGroup, ConditionItem, AuditPicture, CustomerEvaluationResult
-        print("✅ Domain entities imported successfully")
-        
-        from domain.repositories.evaluation_repository import EvaluationRepository
-        print("✅ Domain repository interface imported successfully")
-        
-        # Test infrastructure imports
-        from infrastructure.database.sql_server_connection import SqlServerConnection
-        print("✅ Infrastructure database connection imported successfully")
-        
-        from infrastructure.repositories.sql_server_evaluation_repository import SqlServerEvaluationRepository
-        print("✅ Infrastructure repository imported successfully")
-        
-        return True
-        
+        for mod in _CORE_MODULES:
+            importlib.import_module(mod)
     except ImportError as e:
-        print(f"❌ Import error: {e}")
-        return False
-    except Exception as e:
-        print(f"❌ Unexpected error: {e}")
+        return e
+    return None
+
+
+def verify_imports():
+    """Verify all imports work correctly"""
+    error = _import_core()
+    if error is not None:
+        print(f"❌ Import error: {error}")
         return False
 
+    _emit([
+        "🔍 Testing imports...",
+        "✅ Domain entities imported successfully",
+        "✅ Domain repository interface imported successfully",
+        "✅ Infrastructure database connection imported successfully",
+        "✅ Infrastructure repository imported successfully",
+    ])
+    return True
+
 def verify_instantiation():
     """Verify objects can be instantiated"""
-    try:
-        print("\n🔧 Testing instantiation...")
-        
-        # Create database connection
-        db_connection = SqlServerConnection()
-        print("✅ SqlServerConnection instantiated successfully")
-        
-        # Create repository
-        repository = SqlServerEvaluationRepository(db_connection)
-        print("✅ SqlServerEvaluationRepository instantiated successfully")
-        
-        # Verify it implements the interface
-        assert isinstance(repository, EvaluationRepository)
-        print("✅ SqlServerEvaluationRepository implements EvaluationRepository interface")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Instantiation error: {e}")
-        return False
+    log = ["\n🔧 Testing instantiation..."]
+
+    EvaluationRepository = cached_import(
+        "domain.repositories.evaluation_repository", "EvaluationRepository"
+    )
+
+    # Dựng connection + repository (memoized - verify_methods dùng lại)
+    repository = _build_repository()
+    log.append("✅ SqlServerConnection instantiated successfully")
+    log.append("✅ SqlServerEvaluationRepository instantiated successfully")
+
+    # Verify it implements the interface - repository kế thừa tường minh
+    # nên một phép membership trên tuple __mro__ là đủ, không cần
+    # isinstance đi qua __instancecheck__ của Protocol
+    assert EvaluationRepository in type(repository).__mro__
+    log.append("✅ SqlServerEvaluationRepository implements EvaluationRepository interface")
+
+    _emit(log)
+    return True
 
 def verify_methods():
     """Verify all required methods exist"""
-    try:
-        print("\n📋 Testing method signatures...")
-        
-        from infrastructure.repositories.sql_server_evaluation_repository import SqlServerEvaluationRepository
-        from infrastructure.database.sql_server_connection import SqlServerConnection
-        
-        db_connection = SqlServerConnection()
-        repository = SqlServerEvaluationRepository(db_connection)
-        
-        # Check all required methods exist
-        required_methods = [
-            'get_condition_groups',
-            'get_condition_group_by_id', 
-            'get_condition_items_by_group',
-            'get_condition_items',
-            'get_audit_results',
-            'get_audit_result',
-            'save_audit_result',
-            'save_evaluation_result',
-            'get_evaluation_result'
-        ]
-        
-        for method_name in required_methods:
-            assert hasattr(repository, method_name), f"Missing method: {method_name}"
-            print(f"✅ Method {method_name} exists")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Method verification error: {e}")
+    log = ["\n📋 Testing method signatures..."]
+
+    # Dùng lại instance đã dựng ở verify_instantiation (memoized)
+    repository = _build_repository()
+
+    # Check all required methods exist - một lượt dir() (duyệt tp_dict
+    # + MRO ở C-level) thay cho N phép getattr mỗi phép tự đi lại MRO;
+    # set-diff báo đủ mọi method thiếu trong một lần thay vì dừng giữa chừng
+    required_methods = _required_methods()
+    missing = sorted(required_methods - set(dir(repository)))
+    if missing:
+        print(f"❌ Missing methods: {missing}")
         return False
+    # Bind một lần ngoài vòng lặp: bỏ N lần resolve log.append +
+    # dựng f-string, mỗi vòng chỉ còn hai direct call
+    append = log.append
+    fmt = "✅ Method {} exists".format
+    for method_name in required_methods:
+        append(fmt(method_name))
+
+    _emit(log)
+    return True
+
+# ============================================================================
+# PYTEST WRAPPERS - chạy tường minh: py -m pytest verify_implementation.py
+# ============================================================================
+# Không nằm trong testpaths của pytest.ini nên không bị collect mặc định.
+# Không cần fixture: _import_core/_build_repository/_required_methods đã
+# memoize qua lru_cache, ba test chia sẻ cùng một repository instance
+# đúng như fixture scope="module" - và chạy được song song với -n auto.
+
+def test_imports():
+    """Bốn module cốt lõi import sạch"""
+    assert _import_core() is None
+
+
+def test_instantiation():
+    """Repository dựng được và kế thừa interface"""
+    EvaluationRepository = cached_import(
+        "domain.repositories.evaluation_repository", "EvaluationRepository"
+    )
+    assert EvaluationRepository in type(_build_repository()).__mro__
+
+
+def test_methods():
+    """Repository có đủ mọi method bắt buộc của interface"""
+    assert not _required_methods() - set(dir(_build_repository()))
+
 
 def main():
     """Main verification function"""
@@ -100,17 +220,24 @@ def main():
     print("=" * 60)
     
     success = True
-    
-    # Test imports
-    if not verify_imports():
-        success = False
-    
-    # Test instantiation
-    if not verify_instantiation():
-        success = False
-    
-    # Test methods
-    if not verify_methods():
+
+    # Handler duy nhất ở entry point thay cho try/except Exception bọc
+    # thân từng verify_*: các hàm giữ được đường zero-cost exception của
+    # CPython 3.11 và lỗi bất ngờ không bị nuốt lẫn vào kết quả từng bước
+    try:
+        # Test imports
+        if not verify_imports():
+            success = False
+
+        # Test instantiation
+        if not verify_instantiation():
+            success = False
+
+        # Test methods
+        if not verify_methods():
+            success = False
+    except Exception as e:
+        print(f"❌ Verification error: {e}")
         success = False
     
     print("\n" + "=" * 60)
@@ -128,4 +255,5 @@ def main():
     return 0
 
 if __name__ == "__main__":
+    sys.path.insert(0, _SRC_DIR)
     sys.exit(main())